@@ -1,12 +1,53 @@
-from flask import Flask, render_template, jsonify, request, session, redirect, url_for
-from rdkit import Chem
-from rdkit.Chem import AllChem
+import startup_profile
+startup_profile.install()  # Must run before the imports it should time
+
+from flask import Flask, Response, render_template, jsonify, request, session, redirect, url_for, g, abort, make_response
+from flask.logging import default_handler
+from jinja2 import FileSystemBytecodeCache
+from structured_log import JsonLogWriter
+from collections import OrderedDict
+import hashlib
 import json
+import logging
+import os
 import random
+import sys
+import threading
+import time
+import traceback
 from datetime import datetime
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Compiled templates are kept on disk so cold renders after a restart skip parsing
+JINJA_CACHE_DIR = os.path.join(BASE_DIR, '.jinja_cache')
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+
 app = Flask(__name__)
 app.secret_key = 'organic_chemistry_secret_key_2024'  # For session management
+app.jinja_options = {**app.jinja_options, 'bytecode_cache': FileSystemBytecodeCache(JINJA_CACHE_DIR)}
+app.config['TEMPLATES_AUTO_RELOAD'] = True  # Pick up edited templates without a restart
+
+# Memory budget for rendered pages held by the page cache
+PAGE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# RDKit is imported on the first chemistry request unless preloading is requested
+PRELOAD_RDKIT = os.environ.get('PRELOAD_RDKIT') == '1' or '--preload-rdkit' in sys.argv
+
+# Structured JSON logs; successful requests are sampled, errors are always kept
+LOG_DIR = os.environ.get('LOG_DIR', os.path.join(BASE_DIR, 'logs'))
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+ACCESS_LOG_SAMPLE_RATE = float(os.environ.get('ACCESS_LOG_SAMPLE_RATE', '1.0'))
+
+# Conformational-motion trajectories
+TRAJECTORY_CACHE_MAX_BYTES = 32 * 1024 * 1024
+TRAJECTORY_METHODS = ('auto', 'dihedral', 'interpolate')
+TRAJECTORY_FRAME_COUNTS = (24, 36, 72, 120)
+DEFAULT_TRAJECTORY_FRAMES = 36
+TRAJECTORY_CHUNK_FRAMES = 8  # Frames per chunk when streaming
+TRAJECTORY_MAX_STEP = 0.8  # Å any atom may move between dihedral-scan frames
+TRAJECTORY_ENERGY_WINDOW = 10.0  # kcal/mol above the lowest conformer considered for interpolation
 
 # CBSE Class 12 Organic Compounds Database
 ORGANIC_COMPOUNDS = {
@@ -220,6 +261,13 @@ ORGANIC_COMPOUNDS = {
         "category": "Alkanes",
         "description": "Four-carbon alkane, lighter fuel"
     },
+    "cyclohexane": {
+        "name": "Cyclohexane",
+        "formula": "C₆H₁₂",
+        "smiles": "C1CCCCC1",
+        "category": "Cycloalkanes",
+        "description": "Six-membered ring alkane, chair conformation"
+    },
     "ethene": {
         "name": "Ethene (Ethylene)",
         "formula": "C₂H₄",
@@ -398,9 +446,122 @@ QUIZ_QUESTIONS = [
     }
 ]
 
+# Changes whenever the compound data changes, so cached pages never outlive it
+with startup_profile.step('compound data hash'):
+    COMPOUNDS_VERSION = hashlib.sha1(
+        json.dumps(ORGANIC_COMPOUNDS, sort_keys=True).encode('utf-8')
+    ).hexdigest()
+
+class BoundedCache:
+    """Memory-bounded LRU cache for rendered pages and trajectories"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (version, value, size)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, version):
+        """Return the cached value for key, or None if missing or stale"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                if entry is not None:
+                    self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, version, value, size=None):
+        """Store value for key, evicting least recently used entries to fit"""
+        if size is None:
+            size = len(value)  # Encoded pages
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (version, value, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        _, _, size = self._entries.pop(key)
+        self._size -= size
+
+page_cache = BoundedCache(PAGE_CACHE_MAX_BYTES)
+trajectory_cache = BoundedCache(TRAJECTORY_CACHE_MAX_BYTES)
+_trajectory_locks = {}  # cache key -> lock held while that trajectory is generated
+_trajectory_locks_lock = threading.Lock()
+
+access_log = JsonLogWriter(os.path.join(LOG_DIR, 'access.log'),
+                           max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT)
+error_log = JsonLogWriter(os.path.join(LOG_DIR, 'error.log'),
+                          max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT)
+
+def log_error(event, **fields):
+    """Queue a structured error record"""
+    error_log.write({'event': event, **fields})
+
+# The queued JSON logs replace Werkzeug's per-request lines and the tracebacks
+# Flask writes to stderr, so nothing is logged synchronously per request
+logging.getLogger('werkzeug').setLevel(logging.ERROR)
+app.logger.removeHandler(default_handler)
+app.logger.addHandler(logging.NullHandler())
+app.logger.propagate = False
+
+def template_mtimes(*template_names):
+    """Get modification times of the given templates"""
+    template_dir = os.path.join(app.root_path, app.template_folder)
+    mtimes = []
+    for name in template_names:
+        try:
+            mtimes.append(os.path.getmtime(os.path.join(template_dir, name)))
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+def render_cached_page(key, template_name, build_context):
+    """Render a page through the page cache"""
+    # Editing the compound data, the template or base.html invalidates the entry
+    version = (COMPOUNDS_VERSION, template_mtimes(template_name, 'base.html'))
+    body = page_cache.get(key, version)
+    status = 'HIT'
+    if body is None:
+        body = render_template(template_name, **build_context()).encode('utf-8')
+        page_cache.set(key, version, body)
+        status = 'MISS'
+    g.cache_status = status
+    return body, {'X-Page-Cache': status}
+
+# RDKit modules (and NumPy, which RDKit loads anyway), populated by load_rdkit()
+np = None
+Chem = None
+AllChem = None
+_rdkit_lock = threading.Lock()
+
+def load_rdkit():
+    """Import RDKit on first use so processes that never need it boot faster"""
+    global np, Chem, AllChem
+    if AllChem is None:
+        with _rdkit_lock:
+            if AllChem is None:
+                with startup_profile.step('rdkit import'):
+                    import numpy as numpy_module
+                    from rdkit import Chem as chem_module
+                    from rdkit.Chem import AllChem as allchem_module
+                np = numpy_module
+                Chem = chem_module
+                AllChem = allchem_module
+
+if PRELOAD_RDKIT:
+    load_rdkit()
+
 def generate_3d_coordinates(smiles):
     """Generate 3D coordinates for a molecule from SMILES"""
     try:
+        load_rdkit()
         mol = Chem.MolFromSmiles(smiles)
         if mol is None:
             return None
@@ -434,25 +595,387 @@ def generate_3d_coordinates(smiles):
         
         return {'atoms': atoms, 'bonds': bonds}
     except Exception as e:
-        print(f"Error generating 3D coordinates: {e}")
+        log_error('3d_generation_failed', smiles=smiles, error=str(e))
+        return None
+
+class TrajectoryUnavailable(Exception):
+    """Raised when a molecule has no motion of the requested kind"""
+
+# Single, non-ring bond between two atoms that each have other neighbours
+ROTATABLE_BOND_SMARTS = '[!D1&!$(*#*)]-&!@[!D1&!$(*#*)]'
+
+def _dihedral_atoms(mol, b, c):
+    """Extend bond b-c to a dihedral, preferring the heaviest neighbour on each side"""
+    a = max((n for n in mol.GetAtomWithIdx(b).GetNeighbors() if n.GetIdx() != c),
+            key=lambda n: n.GetAtomicNum()).GetIdx()
+    d = max((n for n in mol.GetAtomWithIdx(c).GetNeighbors() if n.GetIdx() != b),
+            key=lambda n: n.GetAtomicNum()).GetIdx()
+    return (a, b, c, d)
+
+def _pick_dihedral(mol):
+    """Pick the most central rotatable bond and the four atoms defining its dihedral"""
+    best = None
+    for b, c in mol.GetSubstructMatches(Chem.MolFromSmarts(ROTATABLE_BOND_SMARTS)):
+        heavy_b = [n for n in mol.GetAtomWithIdx(b).GetNeighbors() if n.GetIdx() != c and n.GetAtomicNum() > 1]
+        heavy_c = [n for n in mol.GetAtomWithIdx(c).GetNeighbors() if n.GetIdx() != b and n.GetAtomicNum() > 1]
+        # Prefer bonds with heavy atoms on both sides (butane C2-C3 over a methyl spin)
+        score = (min(len(heavy_b), len(heavy_c)), len(heavy_b) + len(heavy_c))
+        if best is None or score > best[0]:
+            best = (score, b, c)
+    if best is None:
+        return None
+    return _dihedral_atoms(mol, best[1], best[2])
+
+def _torsion_quads(mol):
+    """Ring torsions plus one dihedral per rotatable bond"""
+    quads = []
+    for ring in mol.GetRingInfo().AtomRings():
+        size = len(ring)
+        quads.extend(tuple(ring[(k + j) % size] for j in range(4)) for k in range(size))
+    for b, c in mol.GetSubstructMatches(Chem.MolFromSmarts(ROTATABLE_BOND_SMARTS)):
+        quads.append(_dihedral_atoms(mol, b, c))
+    return quads
+
+def _kabsch_onto(moving, reference, atoms):
+    """Superimpose coordinates onto a reference, fitting the rotation on the given atoms"""
+    moving_center, reference_center = moving[atoms].mean(axis=0), reference[atoms].mean(axis=0)
+    u, _, vt = np.linalg.svd((moving[atoms] - moving_center).T @ (reference[atoms] - reference_center))
+    sign = np.sign(np.linalg.det(vt.T @ u.T))
+    rotation = vt.T @ np.diag([1.0, 1.0, sign]) @ u.T
+    return (moving - moving_center) @ rotation.T + reference_center
+
+def _dihedral_scan(mol, props, n_frames):
+    """Rotate the central dihedral through 360° and relax each frame with MMFF"""
+    dihedral = _pick_dihedral(mol)
+    if dihedral is None:
+        raise TrajectoryUnavailable('No rotatable bond to scan')
+    
+    AllChem.EmbedMolecule(mol, randomSeed=42)
+    AllChem.MMFFOptimizeMolecule(mol)
+    conf = mol.GetConformer()
+    start_positions = conf.GetPositions()
+    # Relabelings of equivalent atoms (e.g. methyl hydrogens) that keep the scanned dihedral
+    symmetries = [np.array(match) for match in mol.GetSubstructMatches(mol, uniquify=False, maxMatches=10000)
+                  if all(match[idx] == idx for idx in dihedral)]
+    
+    # Frames are superimposed on the fragment on the b side of the b-c bond,
+    # so that end stays still while the other end turns
+    _, b, c, _ = dihedral
+    anchor, stack = {b}, [b]
+    while stack:
+        for neighbor in mol.GetAtomWithIdx(stack.pop()).GetNeighbors():
+            if neighbor.GetIdx() not in anchor and neighbor.GetIdx() != c:
+                anchor.add(neighbor.GetIdx())
+                stack.append(neighbor.GetIdx())
+    anchor = sorted(anchor | {c})
+    
+    # Hold the other heavy-atom backbone torsions (e.g. butanol's C-C-C-O) at
+    # their starting values, so the chain's far end cannot flip mid-scan
+    held = []
+    for quad in _torsion_quads(mol):
+        if (set(quad[1:3]) != {b, c} and not mol.GetBondBetweenAtoms(quad[1], quad[2]).IsInRing()
+                and all(mol.GetAtomWithIdx(idx).GetAtomicNum() > 1 for idx in quad)):
+            held.append((quad, AllChem.GetDihedralDeg(conf, *quad)))
+    
+    def closest(candidates, reference):
+        aligned = [_kabsch_onto(candidate, reference, anchor) for candidate in candidates]
+        return min(aligned, key=lambda positions: ((positions - reference) ** 2).sum())
+    
+    def relax(i, starts):
+        """Relax frame i from the lowest-energy start that keeps playback continuous"""
+        angle = 360.0 * i / n_frames - 180.0
+        candidates = []
+        for positions in starts:
+            for idx, position in enumerate(positions.tolist()):
+                conf.SetAtomPosition(idx, position)
+            AllChem.SetDihedralDeg(conf, *dihedral, angle)
+            ff = AllChem.MMFFGetMoleculeForceField(mol, props)
+            ff.MMFFAddTorsionConstraint(*dihedral, False, angle, angle, 1.0e4)
+            for quad, value in held:
+                ff.MMFFAddTorsionConstraint(*quad, False, value, value, 1.0e2)
+            ff.Minimize(maxIts=500)
+            energy = AllChem.MMFFGetMoleculeForceField(mol, props).CalcEnergy()
+            positions = conf.GetPositions()
+            if i:
+                # Relabel equivalent atoms to line up with the previous frame
+                positions = closest([positions[symmetry] for symmetry in symmetries], frames[i - 1])
+            candidates.append((energy, positions))
+        # The first start continues from the previous frame; others are only
+        # taken if no atom has to jump to reach them
+        continuous = [candidate for candidate in candidates if i == 0 or
+                      np.linalg.norm(candidate[1] - frames[i - 1], axis=1).max() < TRAJECTORY_MAX_STEP]
+        energies[i], frames[i] = min(continuous or candidates[:1], key=lambda candidate: candidate[0])
+    
+    # Relax -180°..0° frame by frame. Also trying the optimized conformer lets
+    # methyl rotors dragged along by the scan escape instead of snapping
+    half = n_frames // 2
+    frames = np.empty((n_frames, mol.GetNumAtoms(), 3))
+    energies = np.empty(n_frames)
+    relax(0, (start_positions,))
+    for i in range(1, half + 1):
+        relax(i, (frames[i - 1], start_positions))
+    
+    # When the mirrored syn and anti frames are themselves with equivalent
+    # atoms relabeled (butane, ethane), 0°..180° is the mirror image of the first
+    # half, which makes the profile exactly symmetric. Otherwise (e.g. an OH
+    # hydrogen or a CH(CH3)(OH) centre on the turning end) keep scanning.
+    mirror = np.array([-1.0, 1.0, 1.0])
+    syn, anti = frames[half], frames[0]
+    relabel = min(symmetries, key=lambda symmetry: (
+        (_kabsch_onto((syn * mirror)[symmetry], syn, anchor) - syn) ** 2).sum())
+    # The anti frame must map onto itself the same way, or playback jumps where it loops
+    mirror_rms = max(
+        np.sqrt(((_kabsch_onto((frame * mirror)[relabel], frame, anchor) - frame) ** 2).sum(axis=1).mean())
+        for frame in (syn, anti))
+    if mirror_rms < 0.2:
+        for i in range(half + 1, n_frames):
+            frames[i] = _kabsch_onto((frames[n_frames - i] * mirror)[relabel], frames[0], anchor)
+            energies[i] = energies[n_frames - i]
+    else:
+        for i in range(half + 1, n_frames):
+            relax(i, (frames[i - 1], start_positions))
+    return frames.astype(np.float32), energies, list(dihedral)
+
+def _wrap_degrees(angles):
+    """Wrap angles into [-180, 180)"""
+    return (angles + 180.0) % 360.0 - 180.0
+
+def _relax_along_path(mol, props, conf_id, quads, waypoints, positions):
+    """Relax a conformer along torsion waypoints at path positions in [0, 1]"""
+    conf = mol.GetConformer(conf_id)
+    segments = len(waypoints) - 1
+    frames = np.empty((len(positions), mol.GetNumAtoms(), 3), dtype=np.float32)
+    energies = np.empty(len(positions))
+    for i, position in enumerate(positions):
+        segment = min(int(position * segments), segments - 1)
+        fraction = position * segments - segment
+        targets = waypoints[segment] + fraction * (waypoints[segment + 1] - waypoints[segment])
+        # Each frame starts from the previous one so atoms stay on their own face of a ring
+        ff = AllChem.MMFFGetMoleculeForceField(mol, props, confId=conf_id)
+        for quad, target in zip(quads, _wrap_degrees(targets)):
+            ff.MMFFAddTorsionConstraint(*quad, False, target, target, 1.0e3)
+        ff.Minimize(maxIts=1000)
+        frames[i] = conf.GetPositions()
+        energies[i] = AllChem.MMFFGetMoleculeForceField(mol, props, confId=conf_id).CalcEnergy()
+    return frames, energies
+
+def _conformer_interpolation(mol, props, n_frames):
+    """Interpolate torsions from the lowest-energy conformer to a distinct low-energy one"""
+    # Torsions rather than Cartesian coordinates, so a chair flip swaps axial and
+    # equatorial hydrogens instead of passing them through each other
+    quads = _torsion_quads(mol)
+    if not quads:
+        raise TrajectoryUnavailable('No torsions to interpolate')
+    
+    conf_ids = list(AllChem.EmbedMultipleConfs(mol, numConfs=30, randomSeed=42))
+    if not conf_ids:
+        raise TrajectoryUnavailable('Could not embed conformers')
+    results = AllChem.MMFFOptimizeMoleculeConfs(mol, maxIters=2000)
+    conf_energies = {cid: energy for cid, (_, energy) in zip(conf_ids, results)}
+    
+    def torsions(cid):
+        conf = mol.GetConformer(cid)
+        return np.array([AllChem.GetDihedralDeg(conf, *quad) for quad in quads])
+    
+    def distinct(a, b, tolerance=30.0):
+        return np.abs(_wrap_degrees(a - b)).max() > tolerance
+    
+    lowest = min(conf_energies.values())
+    ordered = [cid for cid in sorted(conf_ids, key=conf_energies.get)
+               if conf_energies[cid] - lowest <= TRAJECTORY_ENERGY_WINDOW]
+    start = ordered[0]
+    start_torsions = torsions(start)
+    end_torsions = next((torsions(cid) for cid in ordered if distinct(torsions(cid), start_torsions)), None)
+    if end_torsions is None:
+        raise TrajectoryUnavailable('No distinct conformers to interpolate between')
+    
+    # Unwrap each waypoint relative to the previous one so segments take the short way round
+    def unwrap(points):
+        unwrapped = [points[0]]
+        for point in points[1:]:
+            unwrapped.append(unwrapped[-1] + _wrap_degrees(point - unwrapped[-1]))
+        return unwrapped
+    
+    # The direct path, plus one through each distinct intermediate (a twist-boat
+    # spares a chair flip the flat ring)
+    paths = [unwrap([start_torsions, end_torsions])]
+    intermediates = []
+    for cid in ordered:
+        cid_torsions = torsions(cid)
+        if (distinct(cid_torsions, start_torsions) and distinct(cid_torsions, end_torsions)
+                and all(distinct(cid_torsions, seen, 10.0) for seen in intermediates)):
+            intermediates.append(cid_torsions)
+            paths.append(unwrap([start_torsions, cid_torsions, end_torsions]))
+    
+    # Every path is relaxed from the start conformer
+    start_positions = mol.GetConformer(start).GetPositions()
+    def reset_start():
+        conf = mol.GetConformer(start)
+        for idx, position in enumerate(start_positions.tolist()):
+            conf.SetAtomPosition(idx, position)
+    
+    # Keep the path with the lowest peak on a coarse grid; constrained energies
+    # are an upper bound on the true barrier
+    coarse = np.linspace(0.0, 1.0, 13)
+    peaks = []
+    for path in paths:
+        reset_start()
+        peaks.append(_relax_along_path(mol, props, start, quads, path, coarse)[1].max())
+    best_path = paths[int(np.argmin(peaks))]
+    
+    # Ease from the start conformer to the end one and back. The easing is
+    # symmetric (t[i] == t[n - i]), so only the outward leg is relaxed and the
+    # return leg replays it, which makes playback loop without a hitch
+    reset_start()
+    half = n_frames // 2
+    t = (1.0 - np.cos(2.0 * np.pi * np.arange(half + 1) / n_frames)) / 2.0
+    outward_frames, outward_energies = _relax_along_path(mol, props, start, quads, best_path, t)
+    order = [i if i <= half else n_frames - i for i in range(n_frames)]
+    return outward_frames[order], outward_energies[order], None
+
+def generate_trajectory(smiles, method, n_frames):
+    """Precompute a conformational-motion trajectory, or return None if RDKit fails"""
+    try:
+        load_rdkit()
+        mol = Chem.MolFromSmiles(smiles)
+        if mol is None:
+            return None
+        
+        mol = Chem.AddHs(mol)
+        props = AllChem.MMFFGetMoleculeProperties(mol)
+        if method == 'auto':
+            method = 'dihedral' if _pick_dihedral(mol) is not None else 'interpolate'
+        
+        if method == 'dihedral':
+            frames, energies, dihedral = _dihedral_scan(mol, props, n_frames)
+        else:
+            frames, energies, dihedral = _conformer_interpolation(mol, props, n_frames)
+        
+        return {
+            'method': method,
+            'elements': [atom.GetSymbol() for atom in mol.GetAtoms()],
+            'bonds': [{
+                'atom1': bond.GetBeginAtomIdx(),
+                'atom2': bond.GetEndAtomIdx(),
+                'order': bond.GetBondType().name
+            } for bond in mol.GetBonds()],
+            'dihedral': dihedral,
+            'frames': np.ascontiguousarray(frames, dtype=np.float32),  # (frames, atoms, 3)
+            'energies': (energies - energies.min()).astype(np.float32)  # kcal/mol above the lowest frame
+        }
+    except TrajectoryUnavailable:
+        raise
+    except Exception as e:
+        log_error('trajectory_generation_failed', smiles=smiles, method=method, error=str(e))
         return None
 
+def get_trajectory(compound_id, method, n_frames):
+    """Get a compound's trajectory from the trajectory cache, generating it on a miss"""
+    key = (compound_id, method, n_frames)
+    trajectory = trajectory_cache.get(key, COMPOUNDS_VERSION)
+    g.cache_status = 'HIT'
+    if trajectory is None:
+        with _trajectory_locks_lock:
+            key_lock = _trajectory_locks.setdefault(key, threading.Lock())
+        # Concurrent misses for the same key wait for one generation instead of repeating it
+        with key_lock:
+            trajectory = trajectory_cache.get(key, COMPOUNDS_VERSION)
+            if trajectory is None:
+                g.cache_status = 'MISS'
+                try:
+                    trajectory = generate_trajectory(ORGANIC_COMPOUNDS[compound_id]['smiles'], method, n_frames)
+                except TrajectoryUnavailable as e:
+                    # Cache the reason too, so compounds without motion aren't re-embedded on every request
+                    trajectory_cache.set(key, COMPOUNDS_VERSION, {'unavailable': str(e)}, size=len(str(e)))
+                    raise
+                if trajectory is not None:
+                    trajectory_cache.set(key, COMPOUNDS_VERSION, trajectory,
+                                         size=trajectory['frames'].nbytes + trajectory['energies'].nbytes)
+    if trajectory is not None and 'unavailable' in trajectory:
+        raise TrajectoryUnavailable(trajectory['unavailable'])
+    return trajectory
+
+def json_abort(message, status):
+    """Abort the request with a JSON error body"""
+    abort(make_response(jsonify({'error': message}), status))
+
+def requested_trajectory(compound_id):
+    """Validate trajectory query arguments and return (trajectory, method, n_frames)"""
+    if compound_id not in ORGANIC_COMPOUNDS:
+        json_abort('Compound not found', 404)
+    
+    method = request.args.get('method', 'auto')
+    frames_arg = request.args.get('frames', str(DEFAULT_TRAJECTORY_FRAMES))
+    if method not in TRAJECTORY_METHODS:
+        json_abort(f"method must be one of: {', '.join(TRAJECTORY_METHODS)}", 400)
+    if frames_arg not in {str(count) for count in TRAJECTORY_FRAME_COUNTS}:
+        json_abort(f"frames must be one of: {', '.join(map(str, TRAJECTORY_FRAME_COUNTS))}", 400)
+    n_frames = int(frames_arg)
+    
+    try:
+        trajectory = get_trajectory(compound_id, method, n_frames)
+    except TrajectoryUnavailable as e:
+        json_abort(str(e), 422)
+    if trajectory is None:
+        json_abort('Could not generate trajectory', 500)
+    return trajectory, method, n_frames
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def log_request(response):
+    """Queue an access log record for the request"""
+    if response.status_code < 400 and random.random() >= ACCESS_LOG_SAMPLE_RATE:
+        return response
+    
+    start = g.get('request_start')
+    view_args = request.view_args or {}
+    access_log.write({
+        'event': 'request',
+        'method': request.method,
+        'path': request.path,
+        'route': request.url_rule.rule if request.url_rule else None,
+        'status': response.status_code,
+        'latency_ms': round((time.perf_counter() - start) * 1000, 2) if start else None,
+        'compound_id': view_args.get('compound_id'),
+        'cache': g.get('cache_status')
+    })
+    return response
+
+@app.teardown_request
+def log_unhandled_exception(exc):
+    """Record exceptions that escaped a view"""
+    if exc is None:
+        return
+    view_args = request.view_args or {}
+    log_error('unhandled_exception',
+              method=request.method,
+              path=request.path,
+              route=request.url_rule.rule if request.url_rule else None,
+              compound_id=view_args.get('compound_id'),
+              error=repr(exc),
+              traceback=''.join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
+
 @app.route('/')
 def index():
     """Main page showing all compounds"""
-    categories = {}
-    for compound_id, compound in ORGANIC_COMPOUNDS.items():
-        category = compound['category']
-        if category not in categories:
-            categories[category] = []
-        categories[category].append({
-            'id': compound_id,
-            'name': compound['name'],
-            'formula': compound['formula'],
-            'description': compound['description']
-        })
+    def build_context():
+        categories = {}
+        for compound_id, compound in ORGANIC_COMPOUNDS.items():
+            category = compound['category']
+            if category not in categories:
+                categories[category] = []
+            categories[category].append({
+                'id': compound_id,
+                'name': compound['name'],
+                'formula': compound['formula'],
+                'description': compound['description']
+            })
+        return {'categories': categories}
     
-    return render_template('index.html', categories=categories)
+    return render_cached_page(('index',), 'index.html', build_context)
 
 @app.route('/compound/<compound_id>')
 def compound_detail(compound_id):
@@ -461,7 +984,8 @@ def compound_detail(compound_id):
         return "Compound not found", 404
     
     compound = ORGANIC_COMPOUNDS[compound_id]
-    return render_template('compound.html', compound=compound, compound_id=compound_id)
+    return render_cached_page(('compound_detail', compound_id), 'compound.html',
+                              lambda: {'compound': compound, 'compound_id': compound_id})
 
 @app.route('/api/compound/<compound_id>/3d')
 def get_3d_structure(compound_id):
@@ -480,6 +1004,52 @@ def get_3d_structure(compound_id):
         'structure': structure_data
     })
 
+@app.route('/api/compound/<compound_id>/trajectory')
+def get_trajectory_info(compound_id):
+    """API endpoint describing a conformational-motion trajectory (coordinates stream from frames_url)"""
+    trajectory, method, n_frames = requested_trajectory(compound_id)
+    frame_count, atom_count, _ = trajectory['frames'].shape
+    
+    return jsonify({
+        'compound_id': compound_id,
+        'method': trajectory['method'],
+        'frame_count': frame_count,
+        'atom_count': atom_count,
+        'elements': trajectory['elements'],
+        'bonds': trajectory['bonds'],
+        'dihedral': trajectory['dihedral'],
+        'frame_format': {
+            'dtype': 'float32',
+            'byte_order': 'little',
+            'values_per_frame': 1 + 3 * atom_count,
+            'layout': 'energy (kcal/mol), then x, y, z for each atom'
+        },
+        'frames_url': url_for('stream_trajectory_frames', compound_id=compound_id,
+                              method=method, frames=n_frames)
+    })
+
+@app.route('/api/compound/<compound_id>/trajectory/frames')
+def stream_trajectory_frames(compound_id):
+    """Stream trajectory frames as packed little-endian float32 records"""
+    trajectory, _, _ = requested_trajectory(compound_id)
+    coords = trajectory['frames'].reshape(len(trajectory['frames']), -1)
+    energies = trajectory['energies']
+    frame_count, values = coords.shape[0], coords.shape[1] + 1
+    
+    def generate():
+        for start in range(0, frame_count, TRAJECTORY_CHUNK_FRAMES):
+            stop = min(start + TRAJECTORY_CHUNK_FRAMES, frame_count)
+            chunk = np.empty((stop - start, values), dtype='<f4')
+            chunk[:, 0] = energies[start:stop]
+            chunk[:, 1:] = coords[start:stop]
+            yield chunk.tobytes()
+    
+    return Response(generate(), mimetype='application/octet-stream', headers={
+        'Content-Length': str(frame_count * values * 4),
+        'X-Frame-Count': str(frame_count),
+        'X-Values-Per-Frame': str(values)
+    })
+
 @app.route('/quiz')
 def quiz_home():
     """Quiz home page"""
@@ -644,6 +1214,8 @@ if __name__ == '__main__':
     signal.signal(signal.SIGINT, signal_handler)  # Ctrl+C
     signal.signal(signal.SIGTERM, signal_handler)  # Termination signal
     
+    startup_profile.report()
+    
     try:
         print('🚀 Starting Flask application on http://localhost:6061')
         print('📚 Access your Organic Chemistry 3D app!')
@@ -661,5 +1233,8 @@ if __name__ == '__main__':
         print('\n🛑 Server stopped by user')
     except Exception as e:
         print(f'\n❌ Server error: {e}')
+        log_error('server_error', error=repr(e))
     finally:
+        access_log.close()
+        error_log.close()
         print('✅ Flask application shutdown complete')
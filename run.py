@@ -7,7 +7,8 @@ import sys
 import signal
 import socket
 import subprocess
-from app import app
+import startup_profile
+from app import app, access_log, error_log, log_error
 
 def check_port_available(port):
     """Check if a port is available"""
@@ -56,6 +57,8 @@ def main():
             print(f"❌ Could not free port {port}. Trying a different port...")
             port = 6062  # Try next port
     
+    startup_profile.report()
+    
     try:
         print('🚀 Starting Organic Chemistry 3D Flask Application')
         print(f'🌐 Server running on: http://localhost:{port}')
@@ -76,7 +79,10 @@ def main():
         print('\n🛑 Server stopped by user')
     except Exception as e:
         print(f'\n❌ Server error: {e}')
+        log_error('server_error', error=repr(e))
     finally:
+        access_log.close()
+        error_log.close()
         print('✅ Flask application shutdown complete')
         print('🔄 Port should now be available for reuse')
 
@@ -86,6 +86,10 @@ echo "=================================="
 # Set environment variables for production
 export FLASK_ENV=production
 export PYTHONUNBUFFERED=1
+# RDKit loads on the first structure request; set PRELOAD_RDKIT=1 to load it at boot
+export PRELOAD_RDKIT=${PRELOAD_RDKIT:-0}
+# Set PROFILE_STARTUP=1 to print import and initialization times at boot
+export PROFILE_STARTUP=${PROFILE_STARTUP:-0}
 
 # Run the application
 python3 app.py
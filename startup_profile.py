@@ -0,0 +1,118 @@
+"""
+Startup profiling for the Organic Chemistry 3D Flask application.
+
+Enable with PROFILE_STARTUP=1 or the --profile-startup flag to print how long
+each module took to import and how long each initialization step took.
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+ENABLED = os.environ.get('PROFILE_STARTUP') == '1' or '--profile-startup' in sys.argv
+
+_started = time.perf_counter()
+_import_times = {}  # module name -> import time excluding nested imports (seconds)
+_steps = []  # (label, seconds)
+_stack = []  # time spent in nested imports for each import in progress
+_reported = False
+
+class _TimedLoader:
+    """Wraps a module loader and records how long loading takes"""
+
+    def __init__(self, loader, name):
+        self._loader = loader
+        self._name = name
+
+    def create_module(self, spec):
+        # Extension modules (RDKit's shared libraries) are loaded here
+        return self._timed(self._loader.create_module, spec)
+
+    def exec_module(self, module):
+        try:
+            return self._timed(self._loader.exec_module, module)
+        finally:
+            # Hand the module back its real loader so isinstance checks keep working
+            if getattr(module, '__spec__', None) is not None and module.__spec__.loader is self:
+                module.__spec__.loader = self._loader
+            if getattr(module, '__loader__', None) is self:
+                module.__loader__ = self._loader
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+    def _timed(self, func, arg):
+        start = time.perf_counter()
+        _stack.append(0.0)
+        try:
+            return func(arg)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = _stack.pop()
+            _import_times[self._name] = _import_times.get(self._name, 0.0) + elapsed - nested
+            if _stack:
+                _stack[-1] += elapsed
+
+class _ImportTimer:
+    """Meta path finder that wraps every found module in a _TimedLoader"""
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None:
+                    spec.loader = _TimedLoader(spec.loader, fullname)
+                return spec
+        return None
+
+_import_timer = _ImportTimer()
+
+def install():
+    """Start timing imports if profiling is enabled"""
+    if ENABLED and _import_timer not in sys.meta_path:
+        sys.meta_path.insert(0, _import_timer)
+
+@contextmanager
+def step(label):
+    """Time an initialization step"""
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _steps.append((label, elapsed))
+        if _reported:
+            # Steps after the report (e.g. lazy imports) are printed as they happen
+            print(f'⏱️  {label}: {elapsed * 1000:.1f} ms')
+
+def report(top=15):
+    """Print the startup breakdown and stop timing imports"""
+    global _reported
+    if not ENABLED or _reported:
+        return
+    if _import_timer in sys.meta_path:
+        sys.meta_path.remove(_import_timer)
+    _reported = True
+
+    by_package = {}
+    for name, seconds in _import_times.items():
+        package = name.split('.')[0]
+        by_package[package] = by_package.get(package, 0.0) + seconds
+
+    total = time.perf_counter() - _started
+    print(f'⏱️  Startup profile: {total * 1000:.1f} ms since profiling started')
+    print(f'   Imports by package ({sum(by_package.values()) * 1000:.1f} ms total):')
+    for package, seconds in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        print(f'     {package:<30} {seconds * 1000:8.1f} ms')
+    print('   Slowest modules:')
+    for name, seconds in sorted(_import_times.items(), key=lambda item: -item[1])[:top]:
+        print(f'     {name:<30} {seconds * 1000:8.1f} ms')
+    if _steps:
+        print('   Initialization steps:')
+        for label, seconds in _steps:
+            print(f'     {label:<30} {seconds * 1000:8.1f} ms')
@@ -0,0 +1,114 @@
+"""
+Structured JSON logging for the Organic Chemistry 3D Flask application.
+
+Request threads only put records on a queue. A background thread writes them
+to disk in batches and rotates the file once it grows past a size limit.
+"""
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+_STOP = object()
+
+class JsonLogWriter:
+    """Writes JSON lines to a size-rotated log file from a background thread"""
+
+    def __init__(self, path, max_bytes=10 * 1024 * 1024, backup_count=5,
+                 batch_size=100, flush_interval=0.5, queue_size=10000):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0  # Records lost because the queue was full
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stream = None
+        self._size = 0
+        self._thread = threading.Thread(
+            target=self._run, name=f'log-writer-{os.path.basename(path)}', daemon=True
+        )
+        self._thread.start()
+
+    def write(self, record):
+        """Queue a record without blocking; it is dropped if the queue is full"""
+        record.setdefault('ts', datetime.now(timezone.utc).isoformat())
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout=5.0):
+        """Flush queued records and stop the writer thread"""
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            # Collect more records until the batch is full or the interval ends
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write_batch(batch)
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _write_batch(self, batch):
+        data = ''.join(
+            json.dumps(record, ensure_ascii=False, default=str) + '\n' for record in batch
+        ).encode('utf-8')
+        try:
+            if self._stream is None:
+                self._open()
+            if self._size > 0 and self._size + len(data) > self.max_bytes:
+                self._rotate()
+            self._stream.write(data)
+            self._stream.flush()
+            self._size += len(data)
+        except OSError as e:
+            print(f'⚠️  Could not write log {self.path}: {e}', file=sys.stderr)
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._stream = open(self.path, 'ab')
+        self._size = self._stream.tell()
+
+    def _rotate(self):
+        """Shift access.log -> access.log.1 -> access.log.2 ... and reopen"""
+        self._stream.close()
+        self._stream = None
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = f'{self.path}.{i}'
+                if os.path.exists(source):
+                    os.replace(source, f'{self.path}.{i + 1}')
+            os.replace(self.path, f'{self.path}.1')
+        else:
+            os.remove(self.path)
+        self._open()